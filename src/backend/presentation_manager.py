@@ -4,13 +4,262 @@ Presentation Manager - Handles multi-screen window management for presentations
 Launches browser windows on specific screens with precise positioning
 """
 
+import concurrent.futures
+import functools
+import importlib
 import json
 import os
 import platform
+import re
+import shutil
+import signal
+import socket
+import stat
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Screen topology rarely changes between back-to-back launches, so detection
+# results are shared by every ScreenManager instance for a short time
+_SCREENS_CACHE: Optional[List[Dict]] = None
+_SCREENS_CACHE_TIME = 0.0
+_SCREENS_CACHE_TTL = 5.0  # seconds
+_SCREENS_LOCK = threading.Lock()
+
+# The CLI runs in a fresh process per launch, so detection results are also
+# kept on disk for a while, keyed by platform, user and X display. The file
+# lives in the per-user runtime dir when there is one; in the shared temp dir
+# only files owned by the current user are trusted. Running with no arguments
+# (the /screens route) always re-detects and refreshes the file. SIGUSR1
+# drops both caches, which is only useful for a --daemon process.
+_SCREENS_DISK_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+    "tansam_screens-{}-{}-{}.json".format(
+        platform.system(),
+        os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", ""),
+        re.sub(r"[^\w.-]", "_", os.environ.get("DISPLAY", "")),
+    ),
+)
+_SCREENS_DISK_CACHE_TTL = 60.0  # seconds
+
+# Assumed when detection fails. Never written to the disk cache, so a
+# transient failure is retried on the next launch.
+_FALLBACK_SCREENS = [
+    {
+        "id": 0,
+        "x": 0,
+        "y": 0,
+        "width": 1920,
+        "height": 1080,
+        "primary": True,
+    }
+]
+
+# Headless machines have no xrandr; look it up once rather than failing a
+# fork+exec on every detection
+_HAS_XRANDR = shutil.which("xrandr") is not None
+
+# Window lookups prefer xdotool and fall back to wmctrl's window list
+_HAS_XDOTOOL = shutil.which("xdotool") is not None
+_HAS_WMCTRL = shutil.which("wmctrl") is not None
+
+# xrandr --listactivemonitors entry, e.g. " 0: +*eDP-1 1920/340x1080/190+0+0  eDP-1",
+# "*" marks the primary monitor and the /N parts are physical sizes in mm
+_XRANDR_MONITOR_RE = re.compile(
+    r"^\s*\d+:\s*\+?(?P<primary>\*)?(?P<name>\S+)\s+"
+    r"(?P<width>\d+)/\d+x(?P<height>\d+)/\d+\+(?P<x>\d+)\+(?P<y>\d+)"
+)
+
+# xrandr output header, e.g. "eDP-1 connected primary 1920x1080+0+0 (...)".
+# Geometry is absent for connected outputs that are switched off.
+_XRANDR_CONNECTED_RE = re.compile(
+    r"^(?P<name>\S+) connected(?: (?P<primary>primary))?"
+    r"(?: (?P<width>\d+)x(?P<height>\d+)\+(?P<x>\d+)\+(?P<y>\d+))?"
+)
+
+# Platform-specific modules (Quartz, ctypes) imported on first use
+_LAZY_MODULES: Dict[str, object] = {}
+
+# Browser names accepted in presentation configs, mapped to their family
+_BROWSER_FAMILIES = {"chrome": "chrome", "chromium": "chrome", "firefox": "firefox"}
+
+# Browser command per OS and browser family. Chrome on Linux depends on what
+# is installed, so it is resolved from PATH instead.
+_BROWSER_COMMANDS = {
+    "Linux": {"firefox": "firefox"},
+    "Darwin": {
+        "chrome": "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "firefox": "/Applications/Firefox.app/Contents/MacOS/firefox",
+    },
+    "Windows": {"chrome": "chrome.exe", "firefox": "firefox.exe"},
+}
+
+# wmctrl-style state for fullscreen windows; split-screen windows stay "above"
+_MAXIMIZED_STATE = "maximized_vert,maximized_horz"
+
+# Upper bound on concurrent window launches in launch_presentations
+_MAX_LAUNCH_WORKERS = 8
+
+# Browsers should outlive the launcher and not share its process group, so
+# they are started in a new session (POSIX) or detached process group (Windows)
+if sys.platform == "win32":
+    _DETACHED_POPEN_KWARGS = {
+        "creationflags": subprocess.DETACHED_PROCESS
+        | subprocess.CREATE_NEW_PROCESS_GROUP
+    }
+else:
+    _DETACHED_POPEN_KWARGS = {"start_new_session": True}
+
+# Fallback window positioning used when ctypes cannot reach user32. Written to
+# disk once and invoked with -File so each launch doesn't regenerate it.
+# Mode: "maximize" to maximize after moving, "topmost" to pin above others.
+_POWERSHELL_POSITION_SCRIPT = r"""
+param([int]$X, [int]$Y, [int]$Width, [int]$Height, [string]$Mode)
+Add-Type @"
+    using System;
+    using System.Runtime.InteropServices;
+    public class Win32 {
+        [DllImport("user32.dll")]
+        public static extern IntPtr GetForegroundWindow();
+        [DllImport("user32.dll")]
+        public static extern bool MoveWindow(IntPtr hWnd, int X, int Y, int nWidth, int nHeight, bool bRepaint);
+        [DllImport("user32.dll")]
+        public static extern bool ShowWindow(IntPtr hWnd, int nCmdShow);
+        [DllImport("user32.dll", SetLastError = true)]
+        public static extern bool SetWindowPos(IntPtr hWnd, IntPtr hWndInsertAfter, int X, int Y, int cx, int cy, uint uFlags);
+    }
+"@
+$HWND_TOPMOST = [IntPtr]::new(-1)
+$SWP_SHOWWINDOW = 0x0040
+
+# Get the foreground window (should be the newly created browser window)
+$hwnd = [Win32]::GetForegroundWindow()
+
+# Restore window if minimized, normalize if maximized
+[Win32]::ShowWindow($hwnd, 1) | Out-Null
+Start-Sleep -Milliseconds 300
+
+# Move and resize the window
+[Win32]::MoveWindow($hwnd, $X, $Y, $Width, $Height, $true) | Out-Null
+Start-Sleep -Milliseconds 300
+
+if ($Mode -eq "maximize") {
+    # SW_MAXIMIZE = 3
+    [Win32]::ShowWindow($hwnd, 3) | Out-Null
+} elseif ($Mode -eq "topmost") {
+    # Keep window on top for split-screen presentations
+    [Win32]::SetWindowPos($hwnd, $HWND_TOPMOST, $X, $Y, $Width, $Height, $SWP_SHOWWINDOW) | Out-Null
+}
+"""
+_POWERSHELL_SCRIPT_LOCK = threading.Lock()
+
+# Socket served by --daemon so callers can skip interpreter startup per launch.
+# Messages in both directions are JSON prefixed with a 4-byte big-endian length.
+_DAEMON_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "tansam_presentation.sock")
+_DAEMON_HEADER = struct.Struct(">I")
+
+
+def _lazy(name: str):
+    """Import a platform-specific module the first time it is needed"""
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        module = _LAZY_MODULES[name] = importlib.import_module(name)
+    return module
+
+
+def _powershell_position_script_path() -> str:
+    """Write the PowerShell positioning script to the temp dir if needed"""
+    path = os.path.join(tempfile.gettempdir(), "tansam_position_window.ps1")
+    with _POWERSHELL_SCRIPT_LOCK:
+        try:
+            with open(path, encoding="utf-8") as f:
+                if f.read() == _POWERSHELL_POSITION_SCRIPT:
+                    return path
+        except OSError:
+            pass
+
+        # Write atomically so concurrent launchers never run a partial script
+        fd, tmp_path = tempfile.mkstemp(suffix=".ps1", dir=os.path.dirname(path))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(_POWERSHELL_POSITION_SCRIPT)
+        os.replace(tmp_path, path)
+    return path
+
+
+def _read_screens_disk_cache() -> Optional[List[Dict]]:
+    """Load screens from the disk cache if it is recent, ours and well-formed"""
+    try:
+        info = os.stat(_SCREENS_DISK_CACHE_PATH)
+        if (
+            not stat.S_ISREG(info.st_mode)
+            or (hasattr(os, "getuid") and info.st_uid != os.getuid())
+            or time.time() - info.st_mtime >= _SCREENS_DISK_CACHE_TTL
+        ):
+            return None
+        with open(_SCREENS_DISK_CACHE_PATH, encoding="utf-8") as f:
+            screens = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if isinstance(screens, list) and screens and all(map(_is_screen, screens)):
+        return screens
+    return None
+
+
+def _is_screen(screen) -> bool:
+    """Check that a cached entry has the shape screen detection produces"""
+    return (
+        isinstance(screen, dict)
+        # type() rather than isinstance() so booleans are rejected
+        and all(
+            type(screen.get(key)) is int for key in ("id", "x", "y", "width", "height")
+        )
+        and isinstance(screen.get("primary"), bool)
+        and isinstance(screen.get("name", ""), str)
+    )
+
+
+def _write_screens_disk_cache(screens: List[Dict]) -> None:
+    """Save screens to the disk cache"""
+    try:
+        # Write atomically so concurrent launchers never read a partial file
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".json", dir=os.path.dirname(_SCREENS_DISK_CACHE_PATH)
+        )
+    except OSError as e:
+        print(f"Could not cache screens: {e}", file=sys.stderr)
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(screens, f)
+        os.replace(tmp_path, _SCREENS_DISK_CACHE_PATH)
+    except OSError as e:
+        print(f"Could not cache screens: {e}", file=sys.stderr)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _remove_screens_disk_cache() -> None:
+    """Delete the disk cache so the next detection runs for real"""
+    try:
+        os.unlink(_SCREENS_DISK_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _on_screens_changed(signum, frame) -> None:
+    """SIGUSR1 handler: forget cached screens"""
+    global _SCREENS_CACHE
+    # No lock here: the interrupted thread may be holding it
+    _SCREENS_CACHE = None
+    _remove_screens_disk_cache()
 
 
 class ScreenManager:
@@ -18,155 +267,298 @@ class ScreenManager:
 
     def __init__(self):
         self.system = platform.system()
+        # Resolve the platform-specific implementations once
+        self._detector = {
+            "Linux": self._detect_screens_linux,
+            "Darwin": self._detect_screens_macos,
+            "Windows": self._detect_screens_windows,
+        }.get(self.system)
+        self._launcher = {
+            "Linux": self._launch_linux,
+            "Darwin": self._launch_macos,
+            "Windows": self._launch_windows,
+        }.get(self.system)
+        self._launcher_at_pos = {
+            "Linux": self._launch_linux_at_position,
+            "Darwin": self._launch_macos_at_position,
+            "Windows": self._launch_windows_at_position,
+        }.get(self.system)
         self.screens = self._detect_screens()
+        self._browser_cmds = {
+            browser: self._resolve_browser(self.system, browser)
+            for browser in _BROWSER_FAMILIES
+        }
+        # Held by launches that position the active/foreground window; on
+        # Windows from launch until placement, so no other window opens in
+        # between
+        self._position_lock = threading.Lock()
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget cached screens so the next ScreenManager re-detects them"""
+        global _SCREENS_CACHE
+        with _SCREENS_LOCK:
+            _SCREENS_CACHE = None
+            _remove_screens_disk_cache()
 
     def _detect_screens(self) -> List[Dict]:
+        """Detect available screens, reusing a recent cached result"""
+        global _SCREENS_CACHE, _SCREENS_CACHE_TIME
+        with _SCREENS_LOCK:
+            now = time.monotonic()
+            if (
+                _SCREENS_CACHE is None
+                or now - _SCREENS_CACHE_TIME >= _SCREENS_CACHE_TTL
+            ):
+                _SCREENS_CACHE = _read_screens_disk_cache()
+                if _SCREENS_CACHE is None:
+                    _SCREENS_CACHE = self._detect_screens_uncached()
+                    if _SCREENS_CACHE is not _FALLBACK_SCREENS:
+                        _write_screens_disk_cache(_SCREENS_CACHE)
+                _SCREENS_CACHE_TIME = now
+            return _SCREENS_CACHE
+
+    def _detect_screens_uncached(self) -> List[Dict]:
         """Detect available screens based on OS"""
-        if self.system == "Linux":
-            return self._detect_screens_linux()
-        elif self.system == "Darwin":  # macOS
-            return self._detect_screens_macos()
-        elif self.system == "Windows":
-            return self._detect_screens_windows()
-        return []
+        if self._detector is None:
+            return []
+        return self._detector()
 
     def _detect_screens_linux(self) -> List[Dict]:
         """Detect screens on Linux using xrandr"""
+        if _HAS_XRANDR:
+            try:
+                screens = self._xrandr_active_monitors()
+                if not screens:
+                    # xrandr < 1.5 has no --listactivemonitors
+                    screens = self._xrandr_connected_outputs()
+            except (OSError, subprocess.SubprocessError) as e:
+                print(f"Error detecting Linux screens: {e}", file=sys.stderr)
+                screens = []
+
+            if screens:
+                return screens
+
+        return _FALLBACK_SCREENS
+
+    def _xrandr_active_monitors(self) -> List[Dict]:
+        """List active monitors; one output line per monitor, no mode lines"""
+        # --current keeps xrandr from re-probing outputs before listing
+        result = subprocess.run(
+            ["xrandr", "--current", "--listactivemonitors"],
+            capture_output=True,
+            text=True,
+            bufsize=-1,
+            timeout=2,
+        )
+        if result.returncode != 0:
+            return []
+
+        screens = []
+        for line in result.stdout.split("\n"):
+            # e.g. " 0: +*eDP-1 1920/340x1080/190+0+0  eDP-1"
+            match = _XRANDR_MONITOR_RE.match(line)
+            if match:
+                screens.append(
+                    {
+                        "id": len(screens),
+                        "x": int(match.group("x")),
+                        "y": int(match.group("y")),
+                        "width": int(match.group("width")),
+                        "height": int(match.group("height")),
+                        "primary": bool(match.group("primary")),
+                        "name": match.group("name"),
+                    }
+                )
+        return screens
+
+    def _xrandr_connected_outputs(self) -> List[Dict]:
+        """List connected outputs with an active mode from xrandr's report"""
+        # --current reports the server's cached configuration instead of
+        # re-probing outputs, which can stall the X server for seconds.
+        # Only re-probe when the cached configuration lists no monitors.
+        screens = self._parse_xrandr_outputs("--current", "--nograb")
+        if not screens:
+            screens = self._parse_xrandr_outputs("--query")
+        return screens or []
+
+    @staticmethod
+    def _parse_xrandr_outputs(*args: str) -> Optional[List[Dict]]:
+        """
+        Parse connected outputs while xrandr is still writing its report
+
+        Lines are consumed from the pipe as they arrive rather than buffering
+        the whole report, which lists every mode of every output. Returns None
+        if xrandr exits with an error.
+        """
+        screens = []
+        with subprocess.Popen(
+            ["xrandr", *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=-1,
+        ) as proc:
+            # Iterating the pipe has no timeout, so kill a hung xrandr instead
+            watchdog = threading.Timer(2, proc.kill)
+            watchdog.start()
+            try:
+                for line in proc.stdout:
+                    # Mode lines vastly outnumber headers and are indented;
+                    # skip them on their first character
+                    if line[0] in " \t" or " connected" not in line:
+                        continue
+
+                    # e.g. "HDMI-1 connected primary 1920x1080+1920+0 (normal ...)"
+                    match = _XRANDR_CONNECTED_RE.match(line)
+
+                    if match and match.group("width"):
+                        screens.append(
+                            {
+                                "id": len(screens),
+                                "x": int(match.group("x")),
+                                "y": int(match.group("y")),
+                                "width": int(match.group("width")),
+                                "height": int(match.group("height")),
+                                "primary": bool(match.group("primary")),
+                                "name": match.group("name"),
+                            }
+                        )
+            finally:
+                watchdog.cancel()
+
+        return screens if proc.returncode == 0 else None
+
+    def _detect_screens_macos(self) -> List[Dict]:
+        """Detect screens on macOS using Quartz display services"""
         try:
-            result = subprocess.run(
-                ["xrandr", "--query"], capture_output=True, text=True
-            )
-            screens = []
-            screen_id = 0
+            Quartz = _lazy("Quartz")
+
+            error, display_ids, count = Quartz.CGGetActiveDisplayList(16, None, None)
+            if error == 0 and count:
+                main_id = Quartz.CGMainDisplayID()
+                screens = []
+                for screen_id, display_id in enumerate(display_ids[:count]):
+                    bounds = Quartz.CGDisplayBounds(display_id)
+                    screens.append(
+                        {
+                            "id": screen_id,
+                            "x": int(bounds.origin.x),
+                            "y": int(bounds.origin.y),
+                            "width": int(bounds.size.width),
+                            "height": int(bounds.size.height),
+                            "primary": display_id == main_id,
+                        }
+                    )
+                return screens
+        except ImportError as e:
+            print(f"Quartz screen detection unavailable: {e}", file=sys.stderr)
+        except Exception as e:
+            print(f"Error detecting macOS screens: {e}", file=sys.stderr)
 
-            for line in result.stdout.split("\n"):
-                # Look for connected displays
-                if " connected" in line:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        display_name = parts[0]
-                        is_primary = "primary" in line
-
-                        # Find the resolution and position info
-                        # Format: 1920x1080+0+0 or 1920x1080+1920+0
-                        import re
-
-                        match = re.search(r"(\d+)x(\d+)\+(\d+)\+(\d+)", line)
-
-                        if match:
-                            width = int(match.group(1))
-                            height = int(match.group(2))
-                            x = int(match.group(3))
-                            y = int(match.group(4))
-
-                            screens.append(
-                                {
-                                    "id": screen_id,
-                                    "x": x,
-                                    "y": y,
-                                    "width": width,
-                                    "height": height,
-                                    "primary": is_primary,
-                                    "name": display_name,
-                                }
-                            )
-                            screen_id += 1
+        return _FALLBACK_SCREENS
 
-            return (
-                screens
-                if screens
-                else [
+    def _detect_screens_windows(self) -> List[Dict]:
+        """Detect screens on Windows using user32 EnumDisplayMonitors"""
+        try:
+            ctypes = _lazy("ctypes")
+            wintypes = _lazy("ctypes.wintypes")
+
+            SM_CXSCREEN, SM_CYSCREEN, SM_CMONITORS = 0, 1, 80
+            MONITORINFOF_PRIMARY = 0x1
+
+            user32 = ctypes.windll.user32
+
+            # Fast path: a single monitor is fully described by system metrics
+            if user32.GetSystemMetrics(SM_CMONITORS) == 1:
+                return [
                     {
                         "id": 0,
                         "x": 0,
                         "y": 0,
-                        "width": 1920,
-                        "height": 1080,
+                        "width": user32.GetSystemMetrics(SM_CXSCREEN),
+                        "height": user32.GetSystemMetrics(SM_CYSCREEN),
                         "primary": True,
                     }
                 ]
-            )
-        except Exception as e:
-            return [
-                {
-                    "id": 0,
-                    "x": 0,
-                    "y": 0,
-                    "width": 1920,
-                    "height": 1080,
-                    "primary": True,
-                }
-            ]
 
-    def _detect_screens_macos(self) -> List[Dict]:
-        """Detect screens on macOS"""
-        try:
-            result = subprocess.run(
-                ["system_profiler", "SPDisplaysDataType"],
-                capture_output=True,
-                text=True,
+            class MONITORINFOEXW(ctypes.Structure):
+                _fields_ = [
+                    ("cbSize", wintypes.DWORD),
+                    ("rcMonitor", wintypes.RECT),
+                    ("rcWork", wintypes.RECT),
+                    ("dwFlags", wintypes.DWORD),
+                    ("szDevice", wintypes.WCHAR * 32),  # CCHDEVICENAME
+                ]
+
+            MONITORENUMPROC = ctypes.WINFUNCTYPE(
+                wintypes.BOOL,
+                wintypes.HMONITOR,
+                wintypes.HDC,
+                ctypes.POINTER(wintypes.RECT),
+                wintypes.LPARAM,
             )
-            # Simplified detection - returns primary screen
-            return [
-                {
-                    "id": 0,
-                    "x": 0,
-                    "y": 0,
-                    "width": 1920,
-                    "height": 1080,
-                    "primary": True,
-                }
-            ]
-        except Exception as e:
-            print(f"Error detecting macOS screens: {e}")
-            return [
-                {
-                    "id": 0,
-                    "x": 0,
-                    "y": 0,
-                    "width": 1920,
-                    "height": 1080,
-                    "primary": True,
-                }
-            ]
 
-    def _detect_screens_windows(self) -> List[Dict]:
-        """Detect screens on Windows"""
-        try:
-            import tkinter as tk
+            monitors = []
+
+            def _on_monitor(hmonitor, hdc, rect, lparam):
+                info = MONITORINFOEXW()
+                info.cbSize = ctypes.sizeof(MONITORINFOEXW)
+                user32.GetMonitorInfoW(hmonitor, ctypes.byref(info))
+                r = info.rcMonitor
+                monitors.append(
+                    (
+                        r.left,
+                        r.top,
+                        r.right - r.left,
+                        r.bottom - r.top,
+                        bool(info.dwFlags & MONITORINFOF_PRIMARY),
+                        info.szDevice,  # e.g. \\.\DISPLAY1
+                    )
+                )
+                return True
 
-            root = tk.Tk()
-            root.update_idletasks()
+            user32.EnumDisplayMonitors(None, None, MONITORENUMPROC(_on_monitor), 0)
 
-            screens = []
-            screen_id = 0
+            if monitors:
+                return [
+                    {
+                        "id": screen_id,
+                        "x": x,
+                        "y": y,
+                        "width": width,
+                        "height": height,
+                        "primary": primary,
+                        "name": name,
+                    }
+                    for screen_id, (x, y, width, height, primary, name) in enumerate(
+                        monitors
+                    )
+                ]
+        except Exception as e:
+            print(f"EnumDisplayMonitors failed: {e}", file=sys.stderr)
 
-            # Get primary screen
-            screens.append(
-                {
-                    "id": screen_id,
-                    "x": 0,
-                    "y": 0,
-                    "width": root.winfo_screenwidth(),
-                    "height": root.winfo_screenheight(),
-                    "primary": True,
-                }
-            )
+        return self._detect_screens_windows_fallback()
 
-            root.destroy()
-            return screens
-        except Exception as e:
-            print(f"Error detecting Windows screens: {e}")
+    def _detect_screens_windows_fallback(self) -> List[Dict]:
+        """Detect the primary screen on Windows from system metrics"""
+        try:
+            ctypes = _lazy("ctypes")
+
+            user32 = ctypes.windll.user32
             return [
                 {
                     "id": 0,
                     "x": 0,
                     "y": 0,
-                    "width": 1920,
-                    "height": 1080,
+                    "width": user32.GetSystemMetrics(0),  # SM_CXSCREEN
+                    "height": user32.GetSystemMetrics(1),  # SM_CYSCREEN
                     "primary": True,
                 }
             ]
+        except Exception as e:
+            print(f"Error detecting Windows screens: {e}", file=sys.stderr)
+            return _FALLBACK_SCREENS
 
     def get_screens(self) -> List[Dict]:
         """Get list of available screens"""
@@ -186,25 +578,35 @@ class ScreenManager:
         Returns:
             Process ID if successful, None otherwise
         """
+        # The cached layout may be stale (e.g. a monitor was just plugged in)
+        if screen_id >= len(self.screens):
+            self.invalidate_cache()
+            self.screens = self._detect_screens()
+
         # If requested screen doesn't exist, fall back to primary screen
         if screen_id >= len(self.screens):
             screen_id = 0
 
         screen = self.screens[screen_id]
 
+        if self._launcher is None:
+            return None
+
         try:
-            if self.system == "Linux":
-                return self._launch_linux(url, screen, browser)
-            elif self.system == "Darwin":
-                return self._launch_macos(url, screen, browser)
-            elif self.system == "Windows":
-                return self._launch_windows(url, screen, browser)
+            return self._launcher(url, screen, browser)
         except Exception as e:
             print(f"Error launching presentation window: {e}")
             return None
 
     def launch_presentation_window_at_position(
-        self, url: str, x: int, y: int, width: int, height: int, browser: str = "chrome"
+        self,
+        url: str,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        browser: str = "chrome",
+        maximize: bool = False,
     ) -> Optional[int]:
         """
         Launch a browser window at a specific position and size
@@ -216,115 +618,72 @@ class ScreenManager:
             width: Window width
             height: Window height
             browser: Browser to use (chrome, firefox, chromium)
+            maximize: Maximize the window on the screen at that position
 
         Returns:
             Process ID if successful, None otherwise
         """
+        if self._launcher_at_pos is None:
+            return None
+
         try:
-            if self.system == "Linux":
-                return self._launch_linux_at_position(url, x, y, width, height, browser)
-            elif self.system == "Darwin":
-                return self._launch_macos(
+            if maximize:
+                return self._launcher(
                     url, {"x": x, "y": y, "width": width, "height": height}, browser
                 )
-            elif self.system == "Windows":
-                return self._launch_windows_at_position(
-                    url, x, y, width, height, browser
-                )
+            return self._launcher_at_pos(url, x, y, width, height, browser)
         except Exception as e:
             print(f"Error launching presentation window at position: {e}")
             return None
 
-    def _launch_linux(self, url: str, screen: Dict, browser: str) -> Optional[int]:
-        """Launch browser on Linux"""
-        browser_cmd = self._get_browser_command(browser)
-
-        # Launch window without position flags - we'll position it with wmctrl
-        cmd = [browser_cmd, "--new-window", url]
-
-        process = subprocess.Popen(
-            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-        time.sleep(2.0)  # Give window time to fully open
-
-        # Try to move and maximize window on the target screen using wmctrl
-        try:
-            # First, unmaximize to allow positioning
-            subprocess.run(
-                [
-                    "wmctrl",
-                    "-r",
-                    ":ACTIVE:",
-                    "-b",
-                    "remove,maximized_vert,maximized_horz",
-                ],
-                timeout=2,
-                capture_output=True,
-            )
+    def launch_presentation_windows_at_positions(
+        self, windows: List[Tuple[str, int, int, int, int, str, bool]]
+    ) -> List[Optional[int]]:
+        """
+        Launch several browser windows at specific positions and sizes
 
-            time.sleep(0.3)
+        On Linux every browser is started up front and the windows are then
+        positioned together, so the wait for windows to appear overlaps
+        instead of being paid per window. Other platforms launch in turn.
 
-            # Move window to the target screen
-            subprocess.run(
-                [
-                    "wmctrl",
-                    "-r",
-                    ":ACTIVE:",
-                    "-e",
-                    f"0,{screen['x']},{screen['y']},{screen['width']},{screen['height']}",
-                ],
-                timeout=2,
-                capture_output=True,
-            )
+        Args:
+            windows: (url, x, y, width, height, browser, maximize) for each
+                window
 
-            time.sleep(0.3)
+        Returns:
+            Process ID for each window (None where the launch failed)
+        """
+        if self.system != "Linux":
+            return [
+                self.launch_presentation_window_at_position(*window)
+                for window in windows
+            ]
 
-            # Now maximize it
-            subprocess.run(
-                ["wmctrl", "-r", ":ACTIVE:", "-b", "add,maximized_vert,maximized_horz"],
-                timeout=2,
-                capture_output=True,
+        try:
+            return self._launch_linux_many_at_positions(windows)
+        except Exception as e:
+            print(
+                f"Error launching presentation windows at positions: {e}",
+                file=sys.stderr,
             )
+            return [None] * len(windows)
 
-        except Exception as e:
-            print(f"wmctrl positioning attempt: {e}", file=sys.stderr)
-            # Try alternative xdotool method
-            try:
-                result = subprocess.run(
-                    ["xdotool", "getactivewindow"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
+    def _launch_linux(self, url: str, screen: Dict, browser: str) -> Optional[int]:
+        """Launch browser on Linux"""
+        # Move the window to the target screen and maximize it there
+        return self._launch_linux_many_at_positions(
+            [
+                (
+                    url,
+                    screen["x"],
+                    screen["y"],
+                    screen["width"],
+                    screen["height"],
+                    browser,
+                    True,
                 )
-                window_id = result.stdout.strip()
-
-                if window_id:
-                    subprocess.run(
-                        [
-                            "xdotool",
-                            "windowmove",
-                            window_id,
-                            str(screen["x"]),
-                            str(screen["y"]),
-                        ],
-                        timeout=2,
-                        capture_output=True,
-                    )
-                    subprocess.run(
-                        [
-                            "xdotool",
-                            "windowsize",
-                            window_id,
-                            str(screen["width"]),
-                            str(screen["height"]),
-                        ],
-                        timeout=2,
-                        capture_output=True,
-                    )
-            except Exception as e2:
-                print(f"xdotool positioning error: {e2}", file=sys.stderr)
-
-        return process.pid
+            ]
+        )[0]
 
     def _launch_macos(self, url: str, screen: Dict, browser: str) -> Optional[int]:
         """Launch browser on macOS"""
@@ -333,10 +692,21 @@ class ScreenManager:
         cmd = [browser_cmd, "--new-window", url]
 
         process = subprocess.Popen(
-            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **_DETACHED_POPEN_KWARGS,
         )
         return process.pid
 
+    def _launch_macos_at_position(
+        self, url: str, x: int, y: int, width: int, height: int, browser: str
+    ) -> Optional[int]:
+        """Launch browser on macOS at a specific position"""
+        return self._launch_macos(
+            url, {"x": x, "y": y, "width": width, "height": height}, browser
+        )
+
     def _launch_windows(self, url: str, screen: Dict, browser: str) -> Optional[int]:
         """Launch browser on Windows"""
         browser_cmd = self._get_browser_command(browser)
@@ -344,52 +714,36 @@ class ScreenManager:
         # Launch window
         cmd = [browser_cmd, "--new-window", url]
 
-        process = subprocess.Popen(
-            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-
-        time.sleep(2.5)  # Give window time to fully open
-
-        # Use PowerShell to position the window
-        try:
-            # Get the window handle by finding the newest window or foreground window
-            powershell_script = f"""
-            Add-Type @"
-                using System;
-                using System.Runtime.InteropServices;
-                public class Win32 {{
-                    [DllImport("user32.dll")]
-                    public static extern IntPtr GetForegroundWindow();
-                    [DllImport("user32.dll")]
-                    public static extern bool MoveWindow(IntPtr hWnd, int X, int Y, int nWidth, int nHeight, bool bRepaint);
-                    [DllImport("user32.dll")]
-                    public static extern bool ShowWindow(IntPtr hWnd, int nCmdShow);
-                    [DllImport("user32.dll")]
-                    public static extern bool IsWindowVisible(IntPtr hWnd);
-                }}
-"@
-            # Try to get the newest Chrome/browser window
-            $hwnd = [Win32]::GetForegroundWindow()
-
-            # Restore window if minimized, normalize if maximized
-            [Win32]::ShowWindow($hwnd, 1)
-            Start-Sleep -Milliseconds 300
+        # Positioning targets the foreground window, so no other window may
+        # open until this one is placed
+        with self._position_lock:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **_DETACHED_POPEN_KWARGS,
+            )
 
-            # Move and resize the window
-            [Win32]::MoveWindow($hwnd, {screen["x"]}, {screen["y"]}, {screen["width"]}, {screen["height"]}, $true)
-            Start-Sleep -Milliseconds 300
+            time.sleep(2.5)  # Give window time to fully open
 
-            # Maximize the window (SW_MAXIMIZE = 3)
-            [Win32]::ShowWindow($hwnd, 3)
-            """
+            try:
+                self._position_foreground_window_win32(
+                    screen["x"],
+                    screen["y"],
+                    screen["width"],
+                    screen["height"],
+                    maximize=True,
+                )
+                return process.pid
+            except Exception as e:
+                print(
+                    f"Win32 positioning failed, using PowerShell: {e}", file=sys.stderr
+                )
 
-            subprocess.run(
-                ["powershell", "-Command", powershell_script],
-                timeout=5,
-                capture_output=True,
+            # Fall back to PowerShell to position the window
+            self._position_foreground_window_powershell(
+                screen["x"], screen["y"], screen["width"], screen["height"], "maximize"
             )
-        except Exception as e:
-            print(f"Windows positioning error: {e}", file=sys.stderr)
 
         return process.pid
 
@@ -397,107 +751,309 @@ class ScreenManager:
         self, url: str, x: int, y: int, width: int, height: int, browser: str
     ) -> Optional[int]:
         """Launch browser on Linux at specific position"""
-        browser_cmd = self._get_browser_command(browser)
+        return self._launch_linux_many_at_positions(
+            [(url, x, y, width, height, browser, False)]
+        )[0]
 
-        # Launch without position flags - we'll position it with wmctrl
-        cmd = [browser_cmd, "--new-window", url]
+    def _launch_linux_many_at_positions(
+        self, windows: List[Tuple[str, int, int, int, int, str, bool]]
+    ) -> List[Optional[int]]:
+        """
+        Launch browsers on Linux, then position all their windows at once
 
-        process = subprocess.Popen(
-            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        A browser that is already running takes over the URL and the launched
+        process exits without a window of its own, so windows that can't be
+        found by pid are matched to the windows that appeared meanwhile.
+        Windows that still can't be identified are positioned as the active
+        window, one at a time.
+        """
+        start = time.monotonic()
+        existing = self._list_windows_linux()
+        processes = []
+        for url, _, _, _, _, browser, _ in windows:
+            try:
+                processes.append(
+                    subprocess.Popen(
+                        [self._get_browser_command(browser), "--new-window", url],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        **_DETACHED_POPEN_KWARGS,
+                    )
+                )
+            except Exception as e:
+                print(f"Error launching presentation window: {e}", file=sys.stderr)
+                processes.append(None)
+
+        launched = [process for process in processes if process]
+        found = iter(self._wait_for_windows_linux(launched))
+        window_ids = [next(found) if process else None for process in processes]
+        states = [_MAXIMIZED_STATE if maximize else "above" for *_, maximize in windows]
+
+        missing = [
+            i
+            for i, (process, window_id) in enumerate(zip(processes, window_ids))
+            if process and not window_id
+        ]
+        if missing and existing is not None:
+            new_ids = self._wait_for_new_windows_linux(
+                existing, window_ids, len(missing), start + 2.0
+            )
+            for i, window_id in zip(missing, new_ids):
+                window_ids[i] = window_id
+
+        placed = [
+            (window_id, x, y, width, height, state)
+            for window_id, (_, x, y, width, height, _, _), state in zip(
+                window_ids, windows, states
+            )
+            if window_id
+        ]
+        script = []
+        for window_id, x, y, width, height, state in placed:
+            script += self._xdotool_position_commands(
+                window_id, x, y, width, height, state
+            )
+
+        if script and not self._run_xdotool_script(script):
+            for window_id, x, y, width, height, state in placed:
+                self._position_window_linux(x, y, width, height, state, window_id)
+
+        unplaced = [
+            (x, y, width, height, state)
+            for process, window_id, (_, x, y, width, height, _, _), state in zip(
+                processes, window_ids, windows, states
+            )
+            if process and not window_id
+        ]
+        if unplaced:
+            # Give windows handed to another browser instance the old
+            # fixed settle time to appear before targeting the active one
+            remaining = start + 2.0 - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            # Targeting the active window is only safe while no other
+            # launch positions one
+            with self._position_lock:
+                for x, y, width, height, state in unplaced:
+                    self._position_window_linux(x, y, width, height, state)
+
+        return [process.pid if process else None for process in processes]
+
+    def _wait_for_windows_linux(
+        self, processes: List[subprocess.Popen], timeout: float = 2.0
+    ) -> List[Optional[str]]:
+        """
+        Wait until each launched browser maps a visible window
+
+        All pending windows are looked up together every 25 ms until they
+        appear, their browsers exit or the timeout passes. Returns the X11
+        window ID per process, or None where it could not be resolved (e.g.
+        neither xdotool nor wmctrl is available, or the browser handed the
+        URL to an already running instance and exited).
+        """
+        if not (_HAS_XDOTOOL or _HAS_WMCTRL):
+            return [None] * len(processes)
+
+        deadline = time.monotonic() + timeout
+        pending = {str(process.pid): process for process in processes}
+        found = {}
+
+        while True:
+            found.update(self._find_windows_linux(list(pending)))
+            pending = {
+                pid: process
+                for pid, process in pending.items()
+                if pid not in found and process.poll() is None
+            }
+            if not pending or time.monotonic() >= deadline:
+                return [found.get(str(process.pid)) for process in processes]
+            time.sleep(0.025)
+
+    def _wait_for_new_windows_linux(
+        self,
+        existing: Dict[int, str],
+        claimed: List[Optional[str]],
+        count: int,
+        deadline: float,
+    ) -> List[str]:
+        """
+        Wait for count windows that are neither in existing nor claimed
+
+        Returns the new window IDs in creation order, which may be fewer than
+        count if the deadline passes first.
+        """
+        known = set(existing) | {
+            int(window_id, 0) for window_id in claimed if window_id
+        }
+        while True:
+            current = self._list_windows_linux() or {}
+            new_ids = sorted(set(current) - known)
+            if len(new_ids) >= count or time.monotonic() >= deadline:
+                return [current[window_id] for window_id in new_ids]
+            time.sleep(0.025)
+
+    @staticmethod
+    def _list_windows_linux() -> Optional[Dict[int, str]]:
+        """Map the numeric ID of each managed window to wmctrl's spelling of it"""
+        if not _HAS_WMCTRL:
+            return None
+        try:
+            result = subprocess.run(
+                ["wmctrl", "-l"], capture_output=True, text=True, timeout=1
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+
+        windows = {}
+        for line in result.stdout.split("\n"):
+            fields = line.split(None, 1)
+            if fields:
+                try:
+                    windows[int(fields[0], 0)] = fields[0]
+                except ValueError:
+                    pass
+        return windows
+
+    @staticmethod
+    def _find_windows_linux(pids: List[str]) -> Dict[str, str]:
+        """Map each pid that owns a visible window to that window's ID"""
+        found = {}
+        try:
+            # One wmctrl window list covers every pid; xdotool needs a
+            # search per pid, so it is only used for a single window
+            if _HAS_XDOTOOL and (len(pids) == 1 or not _HAS_WMCTRL):
+                for pid in pids:
+                    result = subprocess.run(
+                        ["xdotool", "search", "--onlyvisible", "--pid", pid, ""],
+                        capture_output=True,
+                        text=True,
+                        timeout=1,
+                    )
+                    window_ids = result.stdout.split()
+                    if window_ids:
+                        found[pid] = window_ids[0]
+                return found
+
+            result = subprocess.run(
+                ["wmctrl", "-lp"], capture_output=True, text=True, timeout=1
+            )
+        except Exception:
+            # Called on every poll, so a failure just means "not found yet"
+            return found
+
+        wanted = set(pids)
+        # Columns: window ID, desktop, PID, host, title
+        for line in result.stdout.split("\n"):
+            fields = line.split(None, 3)
+            if len(fields) >= 3 and fields[2] in wanted:
+                found.setdefault(fields[2], fields[0])
+        return found
+
+    def _position_window_linux(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        state: str,
+        window_id: Optional[str] = None,
+    ) -> None:
+        """
+        Move a window and apply a wmctrl-style state to it
+
+        Targets window_id when known, otherwise the active window. All steps
+        run as a single xdotool script read from stdin, so there is one
+        process launch and no sleeps between steps. wmctrl is used as a
+        fallback when xdotool is missing or too old to support windowstate.
+        """
+        script = [] if window_id else ["getactivewindow"]
+        script += self._xdotool_position_commands(
+            window_id or "%1", x, y, width, height, state
         )
+        if self._run_xdotool_script(script) or not _HAS_WMCTRL:
+            return
 
-        # Wait for window to appear
-        time.sleep(2.0)
+        if window_id:
+            wmctrl_target = ["-i", "-r", window_id]
+            settle = 0.0
+        else:
+            # Give focus changes time to land before re-reading :ACTIVE:
+            wmctrl_target = ["-r", ":ACTIVE:"]
+            settle = 0.3
 
-        # Get the window ID of the newly created window
         try:
             # First, remove any maximization
             subprocess.run(
                 [
                     "wmctrl",
-                    "-r",
-                    ":ACTIVE:",
+                    *wmctrl_target,
                     "-b",
                     "remove,maximized_vert,maximized_horz",
                 ],
                 timeout=2,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
-            time.sleep(0.3)
+            time.sleep(settle)
 
             # Now position and resize the window
             # Format: gravity,x,y,width,height (gravity 0 = use x,y as-is)
             subprocess.run(
-                ["wmctrl", "-r", ":ACTIVE:", "-e", f"0,{x},{y},{width},{height}"],
+                ["wmctrl", *wmctrl_target, "-e", f"0,{x},{y},{width},{height}"],
                 timeout=2,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
-            time.sleep(0.2)
+            time.sleep(settle)
 
-            # Remove decorations for cleaner look (optional)
             subprocess.run(
-                ["wmctrl", "-r", ":ACTIVE:", "-b", "add,above"],
+                ["wmctrl", *wmctrl_target, "-b", f"add,{state}"],
                 timeout=2,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
-
         except Exception as e:
             print(f"wmctrl positioning error: {e}", file=sys.stderr)
-            # Try alternative method using xdotool if available
-            try:
-                # Get active window ID
-                result = subprocess.run(
-                    ["xdotool", "getactivewindow"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                window_id = result.stdout.strip()
-
-                if window_id:
-                    # Unmaximize
-                    subprocess.run(
-                        [
-                            "xdotool",
-                            "windowstate",
-                            "--remove",
-                            "MAXIMIZED_VERT",
-                            window_id,
-                        ],
-                        timeout=2,
-                        capture_output=True,
-                    )
-                    subprocess.run(
-                        [
-                            "xdotool",
-                            "windowstate",
-                            "--remove",
-                            "MAXIMIZED_HORZ",
-                            window_id,
-                        ],
-                        timeout=2,
-                        capture_output=True,
-                    )
 
-                    time.sleep(0.2)
-
-                    # Move and resize
-                    subprocess.run(
-                        ["xdotool", "windowmove", window_id, str(x), str(y)],
-                        timeout=2,
-                        capture_output=True,
-                    )
-                    subprocess.run(
-                        ["xdotool", "windowsize", window_id, str(width), str(height)],
-                        timeout=2,
-                        capture_output=True,
-                    )
-            except Exception as e2:
-                print(f"xdotool positioning error: {e2}", file=sys.stderr)
+    @staticmethod
+    def _xdotool_position_commands(
+        target: str, x: int, y: int, width: int, height: int, state: str
+    ) -> List[str]:
+        """Build xdotool script lines that move a window and apply a state"""
+        commands = [
+            f"windowstate --remove MAXIMIZED_VERT {target}",
+            f"windowstate --remove MAXIMIZED_HORZ {target}",
+            f"windowmove {target} {x} {y}",
+            f"windowsize {target} {width} {height}",
+        ]
+        commands += [
+            f"windowstate --add {prop.upper()} {target}" for prop in state.split(",")
+        ]
+        return commands
+
+    @staticmethod
+    def _run_xdotool_script(commands: List[str]) -> bool:
+        """Run xdotool commands in a single process via stdin"""
+        if not _HAS_XDOTOOL:
+            return False
 
-        return process.pid
+        try:
+            result = subprocess.run(
+                ["xdotool", "-"],
+                input="\n".join(commands) + "\n",
+                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=2,
+            )
+            return result.returncode == 0
+        except Exception as e:
+            print(f"xdotool positioning error: {e}", file=sys.stderr)
+            return False
 
     def _launch_windows_at_position(
         self, url: str, x: int, y: int, width: int, height: int, browser: str
@@ -508,89 +1064,222 @@ class ScreenManager:
         # Launch window
         cmd = [browser_cmd, "--new-window", url]
 
-        process = subprocess.Popen(
-            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-
-        # Wait for window to appear
-        time.sleep(2.5)
+        # Positioning targets the foreground window, so no other window may
+        # open until this one is placed
+        with self._position_lock:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **_DETACHED_POPEN_KWARGS,
+            )
 
-        # Use PowerShell to position the window at specific coordinates
-        try:
-            powershell_script = f"""
-            Add-Type @"
-                using System;
-                using System.Runtime.InteropServices;
-                public class Win32 {{
-                    [DllImport("user32.dll")]
-                    public static extern IntPtr GetForegroundWindow();
-                    [DllImport("user32.dll")]
-                    public static extern bool MoveWindow(IntPtr hWnd, int X, int Y, int nWidth, int nHeight, bool bRepaint);
-                    [DllImport("user32.dll")]
-                    public static extern bool ShowWindow(IntPtr hWnd, int nCmdShow);
-                    [DllImport("user32.dll", SetLastError = true)]
-                    public static extern bool SetWindowPos(IntPtr hWnd, IntPtr hWndInsertAfter, int X, int Y, int cx, int cy, uint uFlags);
-                }}
-"@
-            $HWND_TOPMOST = [IntPtr]::new(-1)
-            $SWP_SHOWWINDOW = 0x0040
+            # Wait for window to appear
+            time.sleep(2.5)
 
-            # Get the foreground window (should be the newly created browser window)
-            $hwnd = [Win32]::GetForegroundWindow()
+            try:
+                self._position_foreground_window_win32(
+                    x, y, width, height, topmost=True
+                )
+                return process.pid
+            except Exception as e:
+                print(
+                    f"Win32 positioning failed, using PowerShell: {e}", file=sys.stderr
+                )
 
-            # Restore window to normal state first
-            [Win32]::ShowWindow($hwnd, 1)
-            Start-Sleep -Milliseconds 300
+            # Fall back to PowerShell to position the window at specific coordinates
+            self._position_foreground_window_powershell(x, y, width, height, "topmost")
 
-            # Move and resize to the specified position
-            [Win32]::MoveWindow($hwnd, {x}, {y}, {width}, {height}, $true)
-            Start-Sleep -Milliseconds 200
+        return process.pid
 
+    def _position_foreground_window_win32(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        maximize: bool = False,
+        topmost: bool = False,
+    ) -> None:
+        """Move the foreground window with direct user32 calls"""
+        ctypes = _lazy("ctypes")
+        wintypes = _lazy("ctypes.wintypes")
+
+        SW_SHOWNORMAL = 1
+        SW_MAXIMIZE = 3
+        HWND_TOPMOST = wintypes.HWND(-1)
+        SWP_SHOWWINDOW = 0x0040
+
+        user32 = ctypes.windll.user32
+        user32.GetForegroundWindow.restype = wintypes.HWND
+        user32.SetWindowPos.argtypes = [
+            wintypes.HWND,
+            wintypes.HWND,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            wintypes.UINT,
+        ]
+
+        # Get the foreground window (should be the newly created browser window)
+        hwnd = user32.GetForegroundWindow()
+        if not hwnd:
+            raise OSError("No foreground window")
+
+        # Restore window if minimized, normalize if maximized
+        user32.ShowWindow(hwnd, SW_SHOWNORMAL)
+        time.sleep(0.3)
+
+        # Move and resize the window
+        user32.MoveWindow(hwnd, x, y, width, height, True)
+        time.sleep(0.2)
+
+        if maximize:
+            user32.ShowWindow(hwnd, SW_MAXIMIZE)
+        if topmost:
             # Keep window on top for split-screen presentations
-            [Win32]::SetWindowPos($hwnd, $HWND_TOPMOST, {x}, {y}, {width}, {height}, $SWP_SHOWWINDOW)
-            """
+            user32.SetWindowPos(hwnd, HWND_TOPMOST, x, y, width, height, SWP_SHOWWINDOW)
 
+    def _position_foreground_window_powershell(
+        self, x: int, y: int, width: int, height: int, mode: str
+    ) -> None:
+        """Move the foreground window with the shared PowerShell script"""
+        try:
             subprocess.run(
-                ["powershell", "-Command", powershell_script],
+                [
+                    "powershell",
+                    "-NoProfile",
+                    "-NonInteractive",
+                    "-ExecutionPolicy",
+                    "Bypass",
+                    "-File",
+                    _powershell_position_script_path(),
+                    str(x),
+                    str(y),
+                    str(width),
+                    str(height),
+                    mode,
+                ],
                 timeout=5,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
         except Exception as e:
             print(f"Windows positioning error: {e}", file=sys.stderr)
 
-        return process.pid
-
     def _get_browser_command(self, browser: str) -> str:
         """Get browser command based on OS and browser type"""
-        if self.system == "Linux":
-            if browser.lower() in ["chrome", "chromium"]:
-                return (
-                    "google-chrome"
-                    if self._command_exists("google-chrome")
-                    else "chromium"
-                )
-            elif browser.lower() == "firefox":
-                return "firefox"
-        elif self.system == "Darwin":
-            if browser.lower() in ["chrome", "chromium"]:
-                return "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-            elif browser.lower() == "firefox":
-                return "/Applications/Firefox.app/Contents/MacOS/firefox"
-        elif self.system == "Windows":
-            if browser.lower() in ["chrome", "chromium"]:
-                return "chrome.exe"
-            elif browser.lower() == "firefox":
-                return "firefox.exe"
-
-        return "google-chrome"  # Default fallback
-
-    def _command_exists(self, command: str) -> bool:
+        return self._browser_cmds.get(browser.lower(), "google-chrome")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolve_browser(system: str, browser: str) -> str:
+        """Resolve a browser command; memoized since it may probe PATH"""
+        family = _BROWSER_FAMILIES.get(browser)
+        if system == "Linux" and family == "chrome":
+            return (
+                "google-chrome"
+                if ScreenManager._command_exists("google-chrome")
+                else "chromium"
+            )
+        return _BROWSER_COMMANDS.get(system, {}).get(family, "google-chrome")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _command_exists(command: str) -> bool:
         """Check if command exists in PATH"""
-        try:
-            subprocess.run(["which", command], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return shutil.which(command) is not None
+
+
+def _build_plan(
+    presentations: List[Dict], screens: List[Dict]
+) -> Tuple[List[List[Dict]], List[str]]:
+    """
+    Assign presentations to screens and compute each window's geometry
+
+    Every screen gets an even share of the presentations and the first few
+    take one extra each. A screen with a single presentation shows it
+    fullscreen; otherwise the screen is split into equal-width columns.
+
+    Returns:
+        (groups, errors) - groups holds the planned windows per screen,
+        errors holds messages for presentations that could not be planned
+    """
+    groups, errors = [], []
+    base, extra = divmod(len(presentations), len(screens))
+
+    presentation_index = 0
+    for screen_id, screen in enumerate(screens):
+        count = base + (1 if screen_id < extra else 0)
+        if count == 0:
+            break
+
+        # Geometry is the same for every window on this screen
+        base_x, base_y = screen["x"], screen["y"]
+        height = screen["height"]
+        window_width = screen["width"] // count
+        split = count > 1
+        group = []
+
+        for i, presentation in enumerate(
+            presentations[presentation_index : presentation_index + count]
+        ):
+            url = presentation.get("url")
+
+            if not url:
+                errors.append("Missing URL in presentation config")
+                continue
+
+            group.append(
+                {
+                    "index": presentation_index + i,
+                    "url": url,
+                    "browser": presentation.get("browser", "chrome"),
+                    "screen_id": screen_id,
+                    "x": base_x + i * window_width,
+                    "y": base_y,
+                    "width": window_width,
+                    "height": height,
+                    "split": split,
+                    "split_index": i,
+                    "split_total": count,
+                }
+            )
+
+        presentation_index += count
+
+        if group:
+            groups.append(group)
+
+    return groups, errors
+
+
+def _window_spec(window: Dict) -> Tuple[str, int, int, int, int, str, bool]:
+    """Build the launch_presentation_windows_at_positions entry for a window"""
+    return (
+        window["url"],
+        window["x"],
+        window["y"],
+        window["width"],
+        window["height"],
+        window["browser"],
+        not window["split"],
+    )
+
+
+def _window_record(window: Dict, pid: int) -> Dict:
+    """Build the result entry for a launched window from its plan"""
+    record = {
+        "screen_id": window["screen_id"],
+        "pid": pid,
+        "url": window["url"],
+        "split": window["split"],
+    }
+    if window["split"]:
+        record["split_index"] = window["split_index"]
+        record["split_total"] = window["split_total"]
+    return record
 
 
 def launch_presentations(config: Dict) -> Dict:
@@ -616,8 +1305,6 @@ def launch_presentations(config: Dict) -> Dict:
             'errors': [str, ...]
         }
     """
-    import random
-
     manager = ScreenManager()
     result = {
         "success": True,
@@ -627,141 +1314,176 @@ def launch_presentations(config: Dict) -> Dict:
     }
 
     presentations = config.get("presentations", [])
-    num_presentations = len(presentations)
-    num_screens = len(manager.screens)
 
-    if num_presentations == 0:
+    if not presentations:
         result["errors"].append("No presentations to launch")
         result["success"] = False
         return result
 
-    # Strategy: Smart distribution based on presentations vs screens
-    if num_presentations <= num_screens:
-        # One presentation per screen - distribute normally
-        for index, presentation in enumerate(presentations):
-            url = presentation.get("url")
-            browser = presentation.get("browser", "chrome")
-
-            if not url:
-                result["errors"].append("Missing URL in presentation config")
-                result["success"] = False
-                continue
-
-            target_screen_id = index % num_screens
-
-            pid = manager.launch_presentation_window(url, target_screen_id, browser)
+    groups, plan_errors = _build_plan(presentations, manager.screens)
+    if plan_errors:
+        result["errors"].extend(plan_errors)
+        result["success"] = False
 
-            if pid:
-                result["windows"].append(
-                    {"screen_id": target_screen_id, "pid": pid, "url": url}
+    # Each entry: (launch function, args, planned windows). The function
+    # returns one pid, or a list of pids for a group of windows.
+    launches = []
+    if manager.system == "Linux":
+        # Every window is launched and positioned as one group, so the waits
+        # for windows to appear overlap across screens too
+        windows = [window for group in groups for window in group]
+        if windows:
+            launches.append(
+                (
+                    manager.launch_presentation_windows_at_positions,
+                    ([_window_spec(window) for window in windows],),
+                    windows,
+                )
+            )
+    else:
+        for group in groups:
+            if group[0]["split"]:
+                # Windows sharing a screen are launched as a group
+                launches.append(
+                    (
+                        manager.launch_presentation_windows_at_positions,
+                        ([_window_spec(window) for window in group],),
+                        group,
+                    )
                 )
             else:
-                result["errors"].append(
-                    f"Failed to launch window {index + 1} on screen {target_screen_id}"
+                # Single presentation - fullscreen
+                window = group[0]
+                launches.append(
+                    (
+                        manager.launch_presentation_window,
+                        (window["url"], window["screen_id"], window["browser"]),
+                        group,
+                    )
                 )
-                result["success"] = False
 
-            # Add delay between launches
-            time.sleep(0.5)
-    else:
-        # More presentations than screens
-        # Calculate how many presentations go on each screen
-        presentations_per_screen = {}
-        remaining = num_presentations
+    # Launches are dominated by waiting on subprocesses, so run them
+    # concurrently. Launches that may position the active/foreground window
+    # still take turns on the manager's position lock.
+    if launches:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(_MAX_LAUNCH_WORKERS, len(launches))
+        ) as executor:
+            futures = [executor.submit(func, *args) for func, args, _ in launches]
+
+            # Collect in submission order so the result order is stable
+            for future, (_, _, windows) in zip(futures, launches):
+                pids = future.result()
+                if not isinstance(pids, list):
+                    pids = [pids]
+
+                for pid, window in zip(pids, windows):
+                    if pid:
+                        result["windows"].append(_window_record(window, pid))
+                    else:
+                        result["errors"].append(
+                            f"Failed to launch window {window['index'] + 1} "
+                            f"on screen {window['screen_id']}"
+                        )
+                        result["success"] = False
 
-        # First, try to fit one per screen
-        for screen_id in range(num_screens):
-            if remaining > 0:
-                presentations_per_screen[screen_id] = 1
-                remaining -= 1
-
-        # Then distribute remaining presentations
-        while remaining > 0:
-            # Pick a random screen to add an extra presentation
-            screen_id = random.randint(0, num_screens - 1)
-            presentations_per_screen[screen_id] = (
-                presentations_per_screen.get(screen_id, 0) + 1
-            )
-            remaining -= 1
+    return result
 
-        # Now launch presentations according to the distribution
-        presentation_index = 0
-        for screen_id in sorted(presentations_per_screen.keys()):
-            count = presentations_per_screen[screen_id]
-            screen = manager.screens[screen_id]
 
-            if count == 1:
-                # Single presentation - fullscreen
-                presentation = presentations[presentation_index]
-                url = presentation.get("url")
-                browser = presentation.get("browser", "chrome")
+def _recv_exact(conn: socket.socket, size: int) -> Optional[bytes]:
+    """Read exactly size bytes, or None if the peer closes the connection"""
+    data = bytearray()
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return bytes(data)
 
-                if not url:
-                    result["errors"].append("Missing URL in presentation config")
-                    result["success"] = False
-                    presentation_index += 1
-                    continue
 
-                pid = manager.launch_presentation_window(url, screen_id, browser)
+def _serve_connection(conn: socket.socket) -> None:
+    """Answer launch requests on one daemon connection until the peer closes it"""
+    while True:
+        header = _recv_exact(conn, _DAEMON_HEADER.size)
+        if header is None:
+            return
+        body = _recv_exact(conn, _DAEMON_HEADER.unpack(header)[0])
+        if body is None:
+            return
 
-                if pid:
-                    result["windows"].append(
-                        {"screen_id": screen_id, "pid": pid, "url": url, "split": False}
-                    )
-                else:
-                    result["errors"].append(
-                        f"Failed to launch window on screen {screen_id}"
-                    )
-                    result["success"] = False
+        try:
+            config = json.loads(body)
+        except json.JSONDecodeError as e:
+            error = f"Invalid JSON: {str(e)}"
+        else:
+            error = None if isinstance(config, dict) else "Config must be an object"
 
-                presentation_index += 1
-            else:
-                # Multiple presentations - split the screen
-                window_width = screen["width"] // count
+        if error is None:
+            result = launch_presentations(config)
+        else:
+            result = {"success": False, "errors": [error], "windows": []}
 
-                for i in range(count):
-                    presentation = presentations[presentation_index]
-                    url = presentation.get("url")
-                    browser = presentation.get("browser", "chrome")
+        payload = json.dumps(result).encode()
+        conn.sendall(_DAEMON_HEADER.pack(len(payload)) + payload)
 
-                    if not url:
-                        result["errors"].append("Missing URL in presentation config")
-                        result["success"] = False
-                        presentation_index += 1
-                        continue
-
-                    x_pos = screen["x"] + (i * window_width)
-                    y_pos = screen["y"]
 
-                    pid = manager.launch_presentation_window_at_position(
-                        url, x_pos, y_pos, window_width, screen["height"], browser
-                    )
+def serve(socket_path: str = _DAEMON_SOCKET_PATH) -> None:
+    """
+    Serve launch_presentations over a Unix domain socket until interrupted
 
-                    if pid:
-                        result["windows"].append(
-                            {
-                                "screen_id": screen_id,
-                                "pid": pid,
-                                "url": url,
-                                "split": True,
-                                "split_index": i,
-                                "split_total": count,
-                            }
-                        )
-                    else:
-                        result["errors"].append(
-                            f"Failed to launch window {presentation_index + 1}"
-                        )
-                        result["success"] = False
+    Each request is a length-prefixed JSON config and gets a length-prefixed
+    JSON result back. A connection may carry several requests in turn.
+    The socket is only accessible to the current user, since the URLs it
+    receives are passed straight to the browser command line.
 
-                    presentation_index += 1
-                    time.sleep(0.5)
+    Raises:
+        RuntimeError: If another daemon is already serving socket_path
+    """
+    if os.path.exists(socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Left behind by a daemon that did not shut down cleanly
+                os.unlink(socket_path)
+            else:
+                raise RuntimeError(f"A daemon is already serving {socket_path}")
 
-    return result
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        # Create the socket owner-only so there is no window before chmod
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(socket_path)
+        finally:
+            os.umask(old_umask)
+        os.chmod(socket_path, 0o600)
+        server.listen()
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    try:
+                        _serve_connection(conn)
+                    except Exception as e:
+                        # One bad client must not take the daemon down
+                        print(f"Daemon connection error: {e}", file=sys.stderr)
+        finally:
+            os.unlink(socket_path)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, _on_screens_changed)
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--daemon":
+        try:
+            serve(sys.argv[2] if len(sys.argv) > 2 else _DAEMON_SOCKET_PATH)
+        except KeyboardInterrupt:
+            pass
+        except RuntimeError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+    elif len(sys.argv) > 1:
         try:
             config = json.loads(sys.argv[1])
             result = launch_presentations(config)
@@ -777,7 +1499,8 @@ if __name__ == "__main__":
                 )
             )
     else:
-        # Test mode
+        # Test mode, also used to list screens, so never answer from cache
+        ScreenManager.invalidate_cache()
         manager = ScreenManager()
         print(
             json.dumps(